@@ -1,70 +1,72 @@
 import numpy as np
-import numba
 
 from scipy.interpolate import splprep, splev
 
 
-@numba.njit()
-def circumradius(points):
-    bc = points[1:] - points[0]
-    d = 2 * (bc[0, 0] * bc[1, 1] - bc[0, 1] * bc[1, 0])
-    b_norm = bc[0, 0] * bc[0, 0] + bc[0, 1] * bc[0, 1]
-    c_norm = bc[1, 0] * bc[1, 0] + bc[1, 1] * bc[1, 1]
-    ux = (bc[1, 1] * b_norm - bc[0, 1] * c_norm) / d
-    uy = (bc[0, 0] * c_norm - bc[1, 0] * b_norm) / d
+def circumradii(points, simplices):
+    """Compute the circumradius of every triangle in ``simplices`` in a single
+    vectorized pass over the triangle vertex coordinates."""
+    bc = points[simplices[:, 1:]] - points[simplices[:, :1]]
+    d = 2 * (bc[:, 0, 0] * bc[:, 1, 1] - bc[:, 0, 1] * bc[:, 1, 0])
+    b_norm = bc[:, 0, 0] * bc[:, 0, 0] + bc[:, 0, 1] * bc[:, 0, 1]
+    c_norm = bc[:, 1, 0] * bc[:, 1, 0] + bc[:, 1, 1] * bc[:, 1, 1]
+    # Degenerate (zero area) triangles get an infinite or nan radius
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ux = (bc[:, 1, 1] * b_norm - bc[:, 0, 1] * c_norm) / d
+        uy = (bc[:, 0, 0] * c_norm - bc[:, 1, 0] * b_norm) / d
     return np.sqrt(ux * ux + uy * uy)
 
 
 def create_boundary_polygons(points, simplices, alpha=0.1):
-    all_edges = set([(np.int32(0), np.int32(0)) for i in range(0)])
-    boundary = set([(np.int32(0), np.int32(0)) for i in range(0)])
-    for simplex in simplices:
-        if circumradius(points[simplex]) < alpha:
-            for e in (
-                (simplex[0], simplex[1]),
-                (simplex[0], simplex[2]),
-                (simplex[1], simplex[2]),
-            ):
-                if e[0] < e[1]:
-                    if (e[0], e[1]) not in all_edges:
-                        all_edges.add((e[0], e[1]))
-                        boundary.add((e[0], e[1]))
-                    else:
-                        boundary.remove((e[0], e[1]))
-                else:
-                    if (e[1], e[0]) not in all_edges:
-                        all_edges.add((e[1], e[0]))
-                        boundary.add((e[1], e[0]))
-                    else:
-                        boundary.remove((e[1], e[0]))
+    with np.errstate(invalid="ignore"):
+        alpha_simplices = simplices[circumradii(points, simplices) < alpha]
 
-    polygons = []
-    search_set = boundary.copy()
-    sequence = list(search_set.pop())
-    while len(search_set) > 0:
-        to_find = sequence[-1]
-        for link in search_set:
-            if link[0] == to_find:
-                sequence.append(link[1])
-                search_set.remove(link)
-                break
-            elif link[1] == to_find:
-                sequence.append(link[0])
-                search_set.remove(link)
-                break
-        else:
-            polygons.append(sequence.copy())
-            sequence = list(search_set.pop())
+    # Boundary edges are exactly those that belong to only one alpha-shape triangle
+    edges = np.vstack(
+        (
+            alpha_simplices[:, [0, 1]],
+            alpha_simplices[:, [0, 2]],
+            alpha_simplices[:, [1, 2]],
+        )
+    )
+    edges.sort(axis=1)
+    edge_keys = edges[:, 0].astype(np.int64) * points.shape[0] + edges[:, 1]
+    unique_keys, key_counts = np.unique(edge_keys, return_counts=True)
+    boundary_keys = unique_keys[key_counts == 1]
+
+    neighbours = {}
+    for u, v in zip(
+        (boundary_keys // points.shape[0]).tolist(),
+        (boundary_keys % points.shape[0]).tolist(),
+    ):
+        neighbours.setdefault(u, set()).add(v)
+        neighbours.setdefault(v, set()).add(u)
 
-    polygons.append(sequence)
+    # Walk boundary edges into closed sequences, consuming each edge once. When
+    # the walk returns to a vertex already on it, that loop is closed off as its
+    # own ring so rings sharing a vertex are never merged into one sequence.
+    polygons = []
+    for start in neighbours:
+        while neighbours[start]:
+            sequence = [start]
+            position = {start: 0}
+            while neighbours[sequence[-1]]:
+                current = sequence[-1]
+                following = neighbours[current].pop()
+                neighbours[following].discard(current)
+                if following in position:
+                    loop_start = position[following]
+                    polygons.append(sequence[loop_start:] + [following])
+                    for vertex in sequence[loop_start + 1 :]:
+                        del position[vertex]
+                    del sequence[loop_start + 1 :]
+                else:
+                    position[following] = len(sequence)
+                    sequence.append(following)
 
     result = [
-        np.empty((len(sequence) + 1, 2), dtype=np.float32) for sequence in polygons
+        points[sequence + [sequence[0]]].astype(np.float32) for sequence in polygons
     ]
-    for s, sequence in enumerate(polygons):
-        for i, n in enumerate(sequence):
-            result[s][i] = points[n]
-        result[s][-1] = points[sequence[0]]
 
     return result
 
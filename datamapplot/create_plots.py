@@ -1,10 +1,11 @@
+import math
 import numpy as np
 import pandas as pd
 import textwrap
 import colorcet
 
 from matplotlib import pyplot as plt
-from matplotlib.colors import to_rgb
+from matplotlib.colors import to_rgb, to_rgba_array
 
 from datamapplot.palette_handling import (
     palette_from_datamap,
@@ -13,7 +14,7 @@ from datamapplot.palette_handling import (
     pastel_palette,
 )
 from datamapplot.plot_rendering import render_plot
-from datamapplot.medoids import medoid
+from datamapplot.medoids import cluster_medoids, cluster_centroids
 from datamapplot.interactive_rendering import (
     render_html,
     label_text_and_polygon_dataframes,
@@ -170,41 +171,35 @@ def create_plot(
         The axes contained within the figure that the plot is rendered to.
 
     """
+    # float32 copy used for palette/label-location computations
+    coords_f32 = np.ascontiguousarray(data_map_coords, dtype=np.float32)
+    label_wrapper = textwrap.TextWrapper(width=label_wrap_width, break_long_words=False)
     if labels is None:
         label_locations = np.zeros((0, 2), dtype=np.float32)
         label_text = []
-        cluster_label_vector = np.full(
-            data_map_coords.shape[0], "Unlabelled", dtype=object
-        )
+        cluster_codes = np.full(data_map_coords.shape[0], -1)
+        uniques = np.asarray(["Unlabelled"], dtype=object)
         unique_non_noise_labels = []
+        label_cluster_sizes = np.zeros(0, dtype=np.int64)
     else:
         cluster_label_vector = np.asarray(labels)
-        unique_non_noise_labels = [
-            label for label in np.unique(cluster_label_vector) if label != noise_label
-        ]
+        # Integer code per point; noise is -1, other labels are 0..n_labels-1
+        codes, uniques = pd.factorize(cluster_label_vector, sort=True)
+        is_noise = np.asarray(uniques == noise_label)
+        cluster_codes = np.where(is_noise, -1, np.cumsum(~is_noise) - 1)[codes]
+        unique_non_noise_labels = uniques[~is_noise].tolist()
+        label_cluster_sizes = np.bincount(codes, minlength=len(uniques))[~is_noise]
         if use_medoids:
-            label_locations = np.asarray(
-                [
-                    medoid(data_map_coords[cluster_label_vector == i])
-                    for i in unique_non_noise_labels
-                ]
+            label_locations = cluster_medoids(
+                coords_f32, cluster_codes, len(unique_non_noise_labels)
             )
         else:
-            label_locations = np.asarray(
-                [
-                    data_map_coords[cluster_label_vector == i].mean(axis=0)
-                    for i in unique_non_noise_labels
-                ]
+            label_locations = cluster_centroids(
+                coords_f32, cluster_codes, len(unique_non_noise_labels)
             )
-        label_text = [
-            textwrap.fill(x, width=label_wrap_width, break_long_words=False)
-            for x in unique_non_noise_labels
-        ]
+        label_text = list(map(label_wrapper.fill, unique_non_noise_labels))
     if highlight_labels is not None:
-        highlight_labels = [
-            textwrap.fill(x, width=label_wrap_width, break_long_words=False)
-            for x in highlight_labels
-        ]
+        highlight_labels = list(map(label_wrapper.fill, highlight_labels))
 
     # If we don't have a color map, generate one
     if cvd_safer:
@@ -212,7 +207,7 @@ def create_plot(
     if label_color_map is None:
         if cmap is None:
             palette = palette_from_datamap(
-                data_map_coords,
+                coords_f32,
                 label_locations,
                 hue_shift=palette_hue_shift,
                 radius_weight_power=palette_hue_radius_dependence,
@@ -221,7 +216,7 @@ def create_plot(
         else:
             palette = palette_from_cmap_and_datamap(
                 cmap,
-                data_map_coords,
+                coords_f32,
                 label_locations,
                 radius_weight_power=palette_hue_radius_dependence,
                 lightness_bounds=(palette_min_lightness, 80),
@@ -229,28 +224,29 @@ def create_plot(
         label_to_index_map = {
             name: index for index, name in enumerate(unique_non_noise_labels)
         }
-        color_list = [
-            palette[label_to_index_map[x]] if x in label_to_index_map else noise_color
-            for x in cluster_label_vector
-        ]
         label_color_map = {
             x: (
                 palette[label_to_index_map[x]]
                 if x in label_to_index_map
                 else noise_color
             )
-            for x in np.unique(cluster_label_vector)
+            for x in uniques
         }
-    else:
-        color_list = [
-            label_color_map[x] if x != noise_label else noise_color
-            for x in cluster_label_vector
-        ]
 
     if marker_color_array is not None:
         color_list = list(marker_color_array)
+        color_codes = None
+        color_palette = None
+    else:
+        # Points are coloured by code; noise (-1) maps to the trailing noise colour
+        color_list = None
+        color_palette = [label_color_map[x] for x in unique_non_noise_labels] + [
+            noise_color
+        ]
+        color_codes = np.where(cluster_codes < 0, len(color_palette) - 1, cluster_codes)
 
     label_colors = [label_color_map[x] for x in unique_non_noise_labels]
+    highlight_colors = label_colors
 
     if type(color_label_text) == str:
         label_text_colors = color_label_text
@@ -270,20 +266,15 @@ def create_plot(
     else:
         label_arrow_colors = None
 
-    cluster_sizes = pd.Series(cluster_label_vector).value_counts()
-    label_cluster_sizes = np.asarray(
-        [cluster_sizes[x] for x in unique_non_noise_labels]
-    )
-
     # Heuristics for point size and alpha values
     n_points = data_map_coords.shape[0]
     if data_map_coords.shape[0] < 100_000 or force_matplotlib:
-        magic_number = np.clip(128 * 4 ** (-np.log10(n_points)), 0.05, 64)
-        point_scale_factor = np.sqrt(figsize[0] * figsize[1])
+        magic_number = min(max(128 * 4 ** (-math.log10(n_points)), 0.05), 64)
+        point_scale_factor = math.sqrt(figsize[0] * figsize[1])
         point_size = magic_number * (point_scale_factor / 2)
-        alpha = np.clip(magic_number, 0.05, 1)
+        alpha = min(max(magic_number, 0.05), 1)
     else:
-        point_size = int(np.sqrt(figsize[0] * figsize[1]) * dpi) // 2048
+        point_size = int(math.sqrt(figsize[0] * figsize[1]) * dpi) // 2048
         alpha = 1.0
 
     if "point_size" in render_plot_kwds:
@@ -302,9 +293,9 @@ def create_plot(
         sub_title=sub_title,
         point_size=point_size,
         alpha=alpha,
-        label_text_colors=None if not color_label_text else label_text_colors,
-        label_arrow_colors=None if not color_label_arrows else label_arrow_colors,
-        highlight_colors=[label_color_map[x] for x in unique_non_noise_labels],
+        label_text_colors=label_text_colors,
+        label_arrow_colors=label_arrow_colors,
+        highlight_colors=highlight_colors,
         figsize=figsize,
         noise_color=noise_color,
         dynamic_label_size=dynamic_label_size,
@@ -312,6 +303,8 @@ def create_plot(
         force_matplotlib=force_matplotlib,
         darkmode=darkmode,
         highlight_labels=highlight_labels,
+        color_codes=color_codes,
+        color_palette=color_palette,
         **render_plot_kwds,
     )
 
@@ -451,6 +444,7 @@ def create_interactive_plot(
     -------
 
     """
+    coords_f32 = np.ascontiguousarray(data_map_coords, dtype=np.float32)
     if len(label_layers) == 0:
         label_dataframe = pd.DataFrame(
             {
@@ -465,14 +459,15 @@ def create_interactive_plot(
             [
                 label_text_and_polygon_dataframes(
                     labels,
-                    data_map_coords,
+                    coords_f32,
                     noise_label=noise_label,
                     use_medoids=use_medoids,
                     cluster_polygons=cluster_boundary_polygons,
                     alpha=polygon_alpha,
                 )
                 for labels in label_layers
-            ]
+            ],
+            ignore_index=True,
         )
 
     if cvd_safer:
@@ -480,7 +475,7 @@ def create_interactive_plot(
     if label_color_map is None:
         if cmap is None:
             palette = palette_from_datamap(
-                data_map_coords,
+                coords_f32,
                 label_dataframe[["x", "y"]].values,
                 hue_shift=palette_hue_shift,
                 radius_weight_power=palette_hue_radius_dependence,
@@ -488,115 +483,86 @@ def create_interactive_plot(
         else:
             palette = palette_from_cmap_and_datamap(
                 cmap,
-                data_map_coords,
+                coords_f32,
                 label_dataframe[["x", "y"]].values,
                 radius_weight_power=palette_hue_radius_dependence,
             )
-        if not darkmode:
-            text_palette = np.asarray(
-                [
-                    tuple(int(c * 255) for c in to_rgb(color))
-                    for color in deep_palette(palette)
-                ]
+        color_map = dict(
+            zip(
+                label_dataframe.label,
+                (to_rgba_array(palette)[:, :3] * 255).astype(np.uint8),
             )
-        else:
-            text_palette = np.asarray(
-                [
-                    tuple(int(c * 255) for c in to_rgb(color))
-                    for color in pastel_palette(palette)
-                ]
-            )
-        palette = [tuple(int(c * 255) for c in to_rgb(color)) for color in palette]
-        color_map = {
-            label: color for label, color in zip(label_dataframe.label, palette)
-        }
+        )
     else:
-        color_map = {
-            label: tuple(int(c * 255) for c in to_rgb(color))
-            for label, color in label_color_map.items()
-        }
-        if not darkmode:
-            text_palette = np.asarray(
-                [
-                    tuple(int(c * 255) for c in to_rgb(color))
-                    for color in deep_palette(
-                        [label_color_map[label] for label in label_dataframe.label]
-                    )
-                ]
-            )
-        else:
-            text_palette = np.asarray(
-                [
-                    tuple(int(c * 255) for c in to_rgb(color))
-                    for color in pastel_palette(
-                        [label_color_map[label] for label in label_dataframe.label]
-                    )
-                ]
+        color_map = dict(
+            zip(
+                label_color_map.keys(),
+                (to_rgba_array(list(label_color_map.values()))[:, :3] * 255).astype(
+                    np.uint8
+                ),
             )
+        )
+        palette = [label_color_map[label] for label in label_dataframe.label]
 
-    if color_label_text or color_cluster_boundaries:
-        label_dataframe["r"] = text_palette.T[0]
-        label_dataframe["g"] = text_palette.T[1]
-        label_dataframe["b"] = text_palette.T[2]
-        label_dataframe["a"] = 64
+    # Darken (or lighten in darkmode) the label colours to get text colours
+    if not darkmode:
+        text_palette = deep_palette(palette)
     else:
-        label_dataframe["r"] = 15 if not darkmode else 240
-        label_dataframe["g"] = 15 if not darkmode else 240
-        label_dataframe["b"] = 15 if not darkmode else 240
-        label_dataframe["a"] = 64
+        text_palette = pastel_palette(palette)
+    text_palette = (to_rgba_array(text_palette)[:, :3] * 255).astype(np.uint8)
 
-    label_dataframe["label"] = label_dataframe.label.map(
-        lambda x: textwrap.fill(x, width=label_wrap_width, break_long_words=False)
-    )
-
-    point_dataframe = pd.DataFrame(
-        {
-            "x": data_map_coords.T[0],
-            "y": data_map_coords.T[1],
-        }
-    )
-    if hover_text is not None:
-        point_dataframe["hover_text"] = np.asarray(hover_text)
+    if color_label_text or color_cluster_boundaries:
+        label_dataframe["r"] = text_palette[:, 0]
+        label_dataframe["g"] = text_palette[:, 1]
+        label_dataframe["b"] = text_palette[:, 2]
+        label_dataframe["a"] = np.uint8(64)
+    else:
+        label_dataframe["r"] = np.uint8(15 if not darkmode else 240)
+        label_dataframe["g"] = np.uint8(15 if not darkmode else 240)
+        label_dataframe["b"] = np.uint8(15 if not darkmode else 240)
+        label_dataframe["a"] = np.uint8(64)
 
-    if marker_size_array is not None:
-        point_dataframe["size"] = np.asarray(marker_size_array)
+    label_wrapper = textwrap.TextWrapper(width=label_wrap_width, break_long_words=False)
+    label_dataframe["label"] = label_dataframe.label.map(label_wrapper.fill)
 
     if marker_color_array is None:
-        color_vector = np.asarray(
-            [tuple(int(c * 255) for c in to_rgb(noise_color))]
-            * data_map_coords.shape[0],
-            dtype=np.uint8,
+        noise_rgb = np.array(
+            [int(c * 255) for c in to_rgb(noise_color)], dtype=np.uint8
         )
+        color_vector = np.broadcast_to(noise_rgb, (data_map_coords.shape[0], 3)).copy()
         for labels in reversed(label_layers):
-            label_map = {n: i for i, n in enumerate(np.unique(labels))}
-            if noise_label not in label_map:
-                label_map[noise_label] = -1
-            label_unmap = {i: n for n, i in label_map.items()}
-            cluster_label_vector = np.asarray(pd.Series(labels).map(label_map))
-            unique_non_noise_labels = [
-                label for label in label_unmap if label != label_map[noise_label]
-            ]
-            for label in unique_non_noise_labels:
-                color_vector[cluster_label_vector == label] = color_map[
-                    label_unmap[label]
-                ]
+            codes, uniques = pd.factorize(np.asarray(labels))
+            is_noise = np.asarray(uniques == noise_label)
+            layer_palette = np.zeros((len(uniques), 3), dtype=np.uint8)
+            for code in np.flatnonzero(~is_noise):
+                layer_palette[code] = color_map[uniques[code]]
+            non_noise = ~is_noise[codes]
+            color_vector[non_noise] = layer_palette[codes[non_noise]]
     else:
-        color_vector = np.asarray(
-            [
-                tuple(int(c * 255) for c in to_rgb(color))
-                for color in marker_color_array
-            ],
-            dtype=np.uint8,
-        )
+        color_vector = (to_rgba_array(marker_color_array)[:, :3] * 255).astype(np.uint8)
+
+    # Gather all point columns first so the dataframe is built in a single step
+    point_columns = {
+        "x": data_map_coords.T[0],
+        "y": data_map_coords.T[1],
+    }
+    if hover_text is not None:
+        point_columns["hover_text"] = np.asarray(hover_text)
 
-    point_dataframe["r"] = color_vector.T[0].astype(np.uint8)
-    point_dataframe["g"] = color_vector.T[1].astype(np.uint8)
-    point_dataframe["b"] = color_vector.T[2].astype(np.uint8)
-    point_dataframe["a"] = np.uint8(180)
+    if marker_size_array is not None:
+        point_columns["size"] = np.asarray(marker_size_array)
+
+    point_columns["r"] = np.ascontiguousarray(color_vector[:, 0])
+    point_columns["g"] = np.ascontiguousarray(color_vector[:, 1])
+    point_columns["b"] = np.ascontiguousarray(color_vector[:, 2])
     if marker_alpha_array is not None:
         if (marker_alpha_array <= 1).all():
             marker_alpha_array *= 255
-        point_dataframe["a"] = marker_alpha_array.astype(np.uint8)
+        point_columns["a"] = marker_alpha_array.astype(np.uint8)
+    else:
+        point_columns["a"] = np.full(data_map_coords.shape[0], 180, dtype=np.uint8)
+
+    point_dataframe = pd.DataFrame(point_columns, copy=False)
 
     html_str = render_html(
         point_dataframe,
@@ -18,7 +18,7 @@ from rjsmin import jsmin
 from scipy.spatial import Delaunay
 
 from datamapplot.alpha_shapes import create_boundary_polygons, smooth_polygon
-from datamapplot.medoids import medoid
+from datamapplot.medoids import cluster_medoids, cluster_centroids
 
 _DECKGL_TEMPLATE_STR = (
     files("datamapplot") / "deckgl_template.html"
@@ -189,27 +189,25 @@ def label_text_and_polygon_dataframes(
     alpha=0.05,
 ):
     cluster_label_vector = np.asarray(labels)
-    unique_non_noise_labels = [
-        label for label in np.unique(cluster_label_vector) if label != noise_label
-    ]
-    label_map = {n: i for i, n in enumerate(unique_non_noise_labels)}
-    label_map[noise_label] = -1
-    cluster_idx_vector = np.asarray(pd.Series(cluster_label_vector).map(label_map))
-
-    label_locations = []
-    cluster_sizes = []
+    codes, uniques = pd.factorize(cluster_label_vector, sort=True)
+    is_noise = np.asarray(uniques == noise_label)
+    cluster_idx_vector = np.where(is_noise, -1, np.cumsum(~is_noise) - 1)[codes]
+    unique_non_noise_labels = uniques[~is_noise].tolist()
+
+    if use_medoids:
+        label_locations = cluster_medoids(
+            data_map_coords, cluster_idx_vector, len(unique_non_noise_labels)
+        )
+    else:
+        label_locations = cluster_centroids(
+            data_map_coords, cluster_idx_vector, len(unique_non_noise_labels)
+        )
+    cluster_sizes = np.bincount(codes, minlength=len(uniques))[~is_noise] ** 0.25
     polygons = []
 
-    for i, _ in enumerate(unique_non_noise_labels):
-        cluster_mask = cluster_idx_vector == i
-        cluster_points = data_map_coords[cluster_mask]
-        if use_medoids:
-            label_locations.append(medoid(cluster_points))
-        else:
-            label_locations.append(cluster_points.mean(axis=0))
-
-        cluster_sizes.append(np.sum(cluster_mask) ** 0.25)
-        if cluster_polygons:
+    if cluster_polygons:
+        for i in range(len(unique_non_noise_labels)):
+            cluster_points = data_map_coords[cluster_idx_vector == i]
             simplices = Delaunay(cluster_points).simplices
             polygons.append(
                 [
@@ -220,8 +218,6 @@ def label_text_and_polygon_dataframes(
                 ]
             )
 
-    label_locations = np.asarray(label_locations)
-
     data = {
         "x": label_locations.T[0],
         "y": label_locations.T[1],
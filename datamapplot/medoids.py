@@ -101,3 +101,50 @@ def medoid(data, arm_budget=20):
         pull_counts = pull_counts[mask]
 
     return data[current_active_arms[0]]
+
+
+@numba.njit()
+def _segment_medoids(sorted_data, starts, ends, arm_budget=20):
+    result = np.empty((starts.shape[0], sorted_data.shape[1]), dtype=np.float32)
+    for c in range(starts.shape[0]):
+        result[c] = medoid(sorted_data[starts[c] : ends[c]], arm_budget)
+    return result
+
+
+def cluster_medoids(data, cluster_codes, n_clusters, arm_budget=20):
+    """Compute the (approximate) medoid of every cluster.
+
+    Points are sorted by cluster code once so that each cluster is a contiguous
+    segment, and the medoids of all segments are then found in a single numba
+    call. Segments are processed serially since ``medoid`` is already parallel
+    internally. Points with a negative code (noise) are ignored. Every code in
+    ``range(n_clusters)`` is assumed to occur at least once.
+    """
+    if n_clusters == 0:
+        return np.zeros((0, data.shape[1]), dtype=np.float32)
+
+    order = np.argsort(cluster_codes, kind="stable")
+    sorted_codes = cluster_codes[order]
+    starts = np.searchsorted(sorted_codes, np.arange(n_clusters), side="left")
+    ends = np.searchsorted(sorted_codes, np.arange(n_clusters), side="right")
+    sorted_data = np.ascontiguousarray(data[order], dtype=np.float32)
+    return _segment_medoids(sorted_data, starts, ends, arm_budget)
+
+
+def cluster_centroids(data, cluster_codes, n_clusters):
+    """Compute the centroid of every cluster in a single vectorized pass.
+
+    Points are sorted by cluster code once and then summed per cluster with
+    ``np.add.reduceat``, rather than masking the full array once per cluster.
+    Points with a negative code (noise) sort to the front and are ignored. Every
+    code in ``range(n_clusters)`` is assumed to occur at least once.
+    """
+    result_dtype = np.promote_types(data.dtype, np.float32)
+    if n_clusters == 0:
+        return np.zeros((0, data.shape[1]), dtype=result_dtype)
+
+    order = np.argsort(cluster_codes, kind="stable")
+    starts = np.searchsorted(cluster_codes[order], np.arange(n_clusters))
+    sums = np.add.reduceat(data[order], starts, axis=0, dtype=np.float64)
+    counts = np.bincount(cluster_codes[cluster_codes >= 0], minlength=n_clusters)
+    return (sums / counts[:, None]).astype(result_dtype)
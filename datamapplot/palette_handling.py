@@ -1,7 +1,7 @@
 import numpy as np
 
 import colorspacious
-from matplotlib.colors import rgb2hex, to_rgb, ListedColormap
+from matplotlib.colors import rgb2hex, to_rgba_array, ListedColormap
 
 
 def palette_from_datamap(
@@ -250,7 +250,7 @@ def palette_from_cmap_and_datamap(
 
 
 def deep_palette(base_palette):
-    initial_palette = [to_rgb(color) for color in base_palette]
+    initial_palette = to_rgba_array(base_palette)[:, :3]
     jch_palette = colorspacious.cspace_convert(initial_palette, "sRGB1", "JCh")
     jch_palette[:, 0] = np.clip(jch_palette[:, 0] / 2.0, 10, 50)
     jch_palette[:, 1] = np.clip(jch_palette[:, 1] - 20, 30, 100)
@@ -264,7 +264,7 @@ def deep_palette(base_palette):
 
 
 def pastel_palette(base_palette):
-    initial_palette = [to_rgb(color) for color in base_palette]
+    initial_palette = to_rgba_array(base_palette)[:, :3]
     jch_palette = colorspacious.cspace_convert(initial_palette, "sRGB1", "JCh")
     jch_palette[:, 0] = np.clip(jch_palette[:, 0] + 30, 60, 100)
     jch_palette[:, 1] = np.clip(jch_palette[:, 0], 5, 20)
@@ -13,6 +13,7 @@ from skimage.transform import rescale
 from matplotlib import pyplot as plt
 from matplotlib import font_manager
 from matplotlib import patheffects
+from matplotlib.colors import to_rgba_array
 
 from datamapplot.overlap_computations import get_2d_coordinates
 from datamapplot.text_placement import (
@@ -66,15 +67,25 @@ def datashader_scatterplot(
     color_list,
     point_size,
     ax,
+    color_codes=None,
+    color_palette=None,
 ):
+    if color_codes is not None:
+        # Integer codes can be used directly as categories, with no colour hashing
+        label = pd.Categorical.from_codes(
+            color_codes, categories=np.arange(len(color_palette))
+        )
+        color_key = list(color_palette)
+    else:
+        label = pd.Categorical(color_list)
+        color_key = {x: x for x in np.unique(color_list)}
     data = pd.DataFrame(
         {
             "x": data_map_coords.T[0],
             "y": data_map_coords.T[1],
-            "label": pd.Categorical(color_list),
+            "label": label,
         }
     )
-    color_key = {x: x for x in np.unique(color_list)}
     dsshow(
         data,
         ds.Point("x", "y"),
@@ -97,16 +108,28 @@ def add_glow_to_scatterplot(
     kernel="gaussian",
     n_levels=8,
     max_alpha=0.5,
+    color_codes=None,
+    color_palette=None,
 ):
     # we are assuming colors are hex strings!
-    unique_colors = np.unique(color_list)
-    color_array = np.asarray(color_list)
-
-    for color in unique_colors:
-        if color == noise_color:
+    if color_codes is None:
+        unique_colors, color_codes = np.unique(color_list, return_inverse=True)
+    else:
+        # Merge codes that share a colour so each colour gets a single glow
+        unique_colors, palette_codes = np.unique(color_palette, return_inverse=True)
+        color_codes = palette_codes[color_codes]
+
+    # Sort once so each colour's points are a contiguous slice rather than a mask
+    order = np.argsort(color_codes, kind="stable")
+    sorted_codes = color_codes[order]
+    starts = np.searchsorted(sorted_codes, np.arange(len(unique_colors)), side="left")
+    ends = np.searchsorted(sorted_codes, np.arange(len(unique_colors)), side="right")
+
+    for i, color in enumerate(unique_colors):
+        if color == noise_color or starts[i] == ends[i]:
             continue
 
-        cluster_embedding = data_map_coords[color_array == color]
+        cluster_embedding = data_map_coords[order[starts[i] : ends[i]]]
 
         # find bounds for the cluster
         xmin, xmax = (
@@ -218,6 +241,8 @@ def render_plot(
     pylabeladjust_radius_scale=1.05,
     label_font_stroke_width=3,
     label_font_outline_alpha=0.5,
+    color_codes=None,
+    color_palette=None,
     ax=None,
     verbose=False,
 ):
@@ -236,9 +261,10 @@ def render_plot(
         The 2D coordinates for the data map. Usually this is produced via a
         dimension reduction technique such as UMAP, t-SNE, PacMAP, PyMDE etc.
 
-    color_list: iterable of str of len n_samples
+    color_list: iterable of str of len n_samples or None
         A list of hex-string colours, one per sample, for colouring points in the
-        scatterplot of the data map.
+        scatterplot of the data map. This may be ``None`` if ``color_codes`` and
+        ``color_palette`` are provided instead.
 
     label_text: list of str
         A list of label text strings, one per unique label.
@@ -433,6 +459,14 @@ def render_plot(
         that distinguishes the text from the background. Larger values will make text more visible
         against the background at some loss of font legibility.
 
+    color_codes: ndarray of ints of shape (n_samples,) or None (optional, default=None)
+        An integer code per sample indexing into ``color_palette``. Together with
+        ``color_palette`` this is a compact alternative to ``color_list``, and avoids
+        per-point colour handling when rendering large data maps.
+
+    color_palette: list of str or None (optional, default=None)
+        A list of hex-string colours indexed by ``color_codes``.
+
     verbose: bool (optional, default=False)
         Print progress as the plot is being created.
 
@@ -479,7 +513,11 @@ def render_plot(
             point_size = marker_size_array * point_size
         ax.scatter(
             *data_map_coords.T,
-            c=color_list,
+            c=(
+                color_list
+                if color_codes is None
+                else to_rgba_array(color_palette)[color_codes]
+            ),
             marker=marker_type,
             s=point_size,
             alpha=alpha,
@@ -491,7 +529,12 @@ def render_plot(
                 "Adjusting marker type or size cannot be done with datashader; use force_matplotlib=True"
             )
         datashader_scatterplot(
-            data_map_coords, color_list, point_size=point_size, ax=ax
+            data_map_coords,
+            color_list,
+            point_size=point_size,
+            ax=ax,
+            color_codes=color_codes,
+            color_palette=color_palette,
         )
 
     # Create background glow
@@ -499,7 +542,13 @@ def render_plot(
         print("Adding glow to scatterplot...")
     if add_glow:
         add_glow_to_scatterplot(
-            data_map_coords, color_list, ax, noise_color=noise_color, **glow_keywords
+            data_map_coords,
+            color_list,
+            ax,
+            noise_color=noise_color,
+            color_codes=color_codes,
+            color_palette=color_palette,
+            **glow_keywords,
         )
 
     # Add a mark in the bottom right if provided
@@ -0,0 +1,50 @@
+import numpy as np
+from scipy.spatial import Delaunay
+
+from datamapplot.alpha_shapes import create_boundary_polygons
+
+
+def _vertex_set(points):
+    return tuple(sorted({tuple(x) for x in points}))
+
+
+def _ring_vertices(ring):
+    # Rings are closed, with the first vertex repeated at the end
+    assert (ring[0] == ring[-1]).all()
+    return _vertex_set(ring[:-1])
+
+
+def test_annulus_boundary():
+    theta = np.linspace(0, 2 * np.pi, 24, endpoint=False)
+    circle = np.column_stack((np.cos(theta), np.sin(theta)))
+    points = np.vstack((circle, 1.5 * circle)).astype(np.float32)
+
+    rings = create_boundary_polygons(points, Delaunay(points).simplices, alpha=0.6)
+
+    assert len(rings) == 2
+    assert sorted(map(_ring_vertices, rings)) == sorted(
+        [_vertex_set(points[:24]), _vertex_set(points[24:])]
+    )
+
+
+def test_shared_vertex_boundary():
+    corners = np.array([[1, 1], [1, -1], [-1, 1], [-1, -1]], dtype=np.float32)
+    centre = np.zeros((1, 2), dtype=np.float32)
+    # Place the shared vertex first and last so the walk starts both on and off it
+    cases = [
+        (np.vstack((centre, corners)), np.array([[0, 1, 2], [0, 3, 4]])),
+        (np.vstack((corners, centre)), np.array([[4, 0, 1], [4, 2, 3]])),
+    ]
+    for points, simplices in cases:
+        rings = create_boundary_polygons(points, simplices, alpha=10.0)
+
+        assert len(rings) == 2
+        assert sorted(map(_ring_vertices, rings)) == sorted(
+            [_vertex_set(points[s]) for s in simplices]
+        )
+
+
+def test_no_alpha_simplices():
+    points = np.random.default_rng(0).random((50, 2)).astype(np.float32)
+
+    assert create_boundary_polygons(points, Delaunay(points).simplices, alpha=0.0) == []
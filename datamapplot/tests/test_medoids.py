@@ -0,0 +1,33 @@
+import numpy as np
+
+from datamapplot.medoids import cluster_centroids, cluster_medoids
+
+
+def test_cluster_medoids():
+    rng = np.random.default_rng(42)
+    centers = np.array([[0.0, 0.0], [20.0, 0.0], [0.0, 20.0]], dtype=np.float32)
+    codes = rng.integers(-1, 3, 3000)
+    data = (rng.normal(size=(3000, 2)) + centers[codes.clip(0)]).astype(np.float32)
+
+    medoids = cluster_medoids(data, codes, 3)
+
+    assert medoids.shape == (3, 2)
+    for c in range(3):
+        cluster_points = data[codes == c]
+        # Each medoid is an actual point of its own cluster
+        assert (cluster_points == medoids[c]).all(axis=1).any()
+        assert np.linalg.norm(medoids[c] - centers[c]) < 2.0
+
+
+def test_cluster_centroids():
+    rng = np.random.default_rng(42)
+    codes = rng.integers(-1, 4, 1000)
+    data = rng.normal(size=(1000, 2)).astype(np.float32)
+
+    centroids = cluster_centroids(data, codes, 4)
+
+    assert centroids.shape == (4, 2)
+    for c in range(4):
+        np.testing.assert_allclose(centroids[c], data[codes == c].mean(0), rtol=1e-5)
+
+    assert cluster_centroids(data[:0], codes[:0], 0).shape == (0, 2)
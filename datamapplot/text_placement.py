@@ -1,6 +1,5 @@
 import numpy as np
 from sklearn.metrics import pairwise_distances
-from sklearn.preprocessing import MinMaxScaler
 from pylabeladjust import adjust_texts
 
 from datamapplot.overlap_computations import (
@@ -208,17 +207,21 @@ def estimate_dynamic_font_size(
 
     overlap_percentage = 1.0
     current_max_font_size = max_font_size
-    weight_scaler = MinMaxScaler(feature_range=(min_font_weight, max_font_weight))
-    font_weights = np.squeeze(
-        weight_scaler.fit_transform(dynamic_size_array.reshape(-1, 1))
+    # Min-max normalize the sizes once; weights and sizes are then linear rescalings
+    dynamic_size_array = np.asarray(dynamic_size_array, dtype=np.float64)
+    size_range = np.ptp(dynamic_size_array)
+    normalized_sizes = (dynamic_size_array - dynamic_size_array.min()) / (
+        size_range if size_range > 0 else 1.0
+    )
+    font_weights = min_font_weight + normalized_sizes * (
+        max_font_weight - min_font_weight
     )
     while (
         overlap_percentage > overlap_percentage_allowed
         and current_max_font_size > min_font_size
     ):
-        size_scaler = MinMaxScaler(feature_range=(min_font_size, current_max_font_size))
-        font_sizes = np.squeeze(
-            size_scaler.fit_transform(dynamic_size_array.reshape(-1, 1))
+        font_sizes = min_font_size + normalized_sizes * (
+            current_max_font_size - min_font_size
         )
         texts = [
             ax.text(